@@ -2,10 +2,14 @@
 GitHub Release 通知自動投稿 OCI Function
 """
 
+import asyncio
+import functools
 import io
-import json
 import logging
 import os
+import threading
+
+import orjson
 from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from fdk import response
@@ -14,6 +18,14 @@ from github_client import GitHubClient
 from llm_summarizer import LLMSummarizer
 from slack_notifier import SlackNotifier
 
+# IOバウンドなfan-out（OpenAI・Slackへの並行呼び出し）を高速化するため、
+# 利用可能であればuvloopをイベントループとして使用する
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 
 # リリース情報を保持する軽量データクラス
 ReleaseInfo = namedtuple('ReleaseInfo', [
@@ -25,6 +37,57 @@ ReleaseInfo = namedtuple('ReleaseInfo', [
 ])
 
 
+# コンテナの生存期間中ずっと使い回す常駐イベントループ。
+# AsyncOpenAI(httpx)のコネクションプールはループに紐づくため、
+# 呼び出しごとにasyncio.run()で使い捨てるとキャッシュしたクライアントが
+# 閉じたループに触れて壊れる（RuntimeError: Event loop is closed）。
+_background_loop = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """常駐イベントループを取得（初回呼び出し時にスレッドごと起動）"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever,
+                name="summarizer-loop",
+                daemon=True
+            ).start()
+    return _background_loop
+
+
+def _run_async(coro):
+    """
+    常駐ループ上でコルーチンを実行して結果を返す
+
+    OCI Functions(fdk)はイベントループ上でhandlerを実行するため
+    asyncio.run()を直接呼べない。常駐ループに投げることで、
+    ウォーム実行間でhttpxのコネクションプールも維持される。
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
+
+# OCI Functionsは同じコンテナでhandlerを繰り返し呼び出すため、
+# クライアントを認証情報ごとにキャッシュしてTLS接続・コネクションプールを
+# ウォーム実行間で再利用する（認証情報の変更はコンテナ再作成で反映される）
+@functools.lru_cache(maxsize=4)
+def _get_github_client(token: str) -> GitHubClient:
+    return GitHubClient(token)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_llm_summarizer(api_key: str, model_name: str) -> LLMSummarizer:
+    return LLMSummarizer(api_key, model_name)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_slack_notifier(webhook_url: str) -> SlackNotifier:
+    return SlackNotifier(webhook_url)
+
+
 def _extract_release_info(release_data: dict) -> ReleaseInfo:
     """
     リリースデータから必要な情報を抽出
@@ -35,28 +98,50 @@ def _extract_release_info(release_data: dict) -> ReleaseInfo:
     Returns:
         ReleaseInfo: 抽出されたリリース情報
     """
-    notification = release_data["notification"]
     release = release_data["release"]
-    repository = notification["repository"]
-
-    return ReleaseInfo(
-        repository_name=repository.get("full_name", "Unknown"),
-        tag_name=release.get("tag_name", "Unknown"),
-        release_body=release.get("body", ""),
-        release_url=release.get("html_url", ""),
-        published_at=release.get("published_at", "")
-    )
+    repository = release_data["notification"]["repository"]
+
+    # _makeはキーワード引数の解析を省くため通常のコンストラクタより速い
+    # （リリースごとに複数回呼ばれるホットパス）
+    return ReleaseInfo._make((
+        repository.get("full_name", "Unknown"),
+        release.get("tag_name", "Unknown"),
+        release.get("body", ""),
+        release.get("html_url", ""),
+        release.get("published_at", "")
+    ))
+
+
+def _has_release_note_content(release_body: str) -> bool:
+    """
+    リリースノートに要約すべき本文があるかを判定
+
+    Args:
+        release_body: リリースノート本文
+
+    Returns:
+        空白・Markdown見出しのみの場合False
+    """
+    if not release_body:
+        return False
+
+    for line in release_body.splitlines():
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            return True
 
+    return False
 
-def _summarize_single_release(
+
+async def _summarize_single_release(
     release_data: dict,
     llm_summarizer: LLMSummarizer,
     openai_model: str,
     index: int,
     total: int
-) -> tuple[dict, str, str]:
+) -> tuple[dict, ReleaseInfo, str, str]:
     """
-    単一のリリースを要約（スレッドプール用）
+    単一のリリースを要約（asyncioタスク用）
 
     Args:
         release_data: リリースデータ（notification + release）
@@ -66,82 +151,97 @@ def _summarize_single_release(
         total: 総数（未使用だがシグネチャ保持のため残す）
 
     Returns:
-        (リリースデータ, 要約, エラーメッセージ)
+        (リリースデータ, リリース情報, 要約, エラーメッセージ)
     """
     info = _extract_release_info(release_data)
 
+    # 本文が空（または見出しのみ）のリリースはOpenAI呼び出しをスキップ
+    # （自動生成タグなどで本文なしのリリースは珍しくない）
+    if not _has_release_note_content(info.release_body):
+        return (release_data, info, "（リリースノートなし）", None)
+
     try:
-        summary = llm_summarizer.summarize(
+        summary = await llm_summarizer.summarize(
             repository=info.repository_name,
             version=info.tag_name,
             release_note=info.release_body
         )
-        return (release_data, summary, None)
+        return (release_data, info, summary, None)
 
     except Exception as e:
         error_msg = f"{info.repository_name} {info.tag_name}: {str(e)}"
-        return (release_data, None, error_msg)
+        return (release_data, info, None, error_msg)
 
 
-def _summarize_all_releases_parallel(
+async def _summarize_all_releases_async(
     release_notifications: list,
     llm_summarizer: LLMSummarizer,
-    logger,
-    openai_model: str
-) -> list[tuple[dict, str, str]]:
+    openai_model: str,
+    logger=None
+) -> list[tuple[dict, ReleaseInfo, str, str]]:
     """
-    全てのリリースを並列要約（ThreadPoolExecutor使用）
+    全てのリリースを並行要約（asyncio使用）
 
     Args:
         release_notifications: リリース通知リスト
         llm_summarizer: LLM要約クライアント
-        logger: ロガー
         openai_model: 使用するOpenAIモデル名
+        logger: ロガー（Noneの場合はprintに出力、ローカルテスト用）
 
     Returns:
-        [(リリースデータ, 要約, エラーメッセージ), ...]
+        [(リリースデータ, リリース情報, 要約, エラーメッセージ), ...]
     """
-    logger.info(f"Starting parallel summarization for {len(release_notifications)} releases")
-
-    # 結果を格納する辞書（インデックスで順序を保持）
-    results_dict = {}
-
-    # ThreadPoolExecutorで並列実行
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        # 全てのタスクを投入
-        future_to_index = {
-            executor.submit(
-                _summarize_single_release,
-                release_data,
-                llm_summarizer,
-                openai_model,
-                idx,
-                len(release_notifications)
-            ): idx
-            for idx, release_data in enumerate(release_notifications, 1)
-        }
+    if logger:
+        log_info, log_error = logger.info, logger.error
+    else:
+        # printには%スタイルの遅延フォーマットがないためここで整形する
+        def _print_log(msg, *args):
+            print(msg % args if args else msg)
+        log_info = log_error = _print_log
 
-        # 完了したタスクから結果を収集
-        for future in as_completed(future_to_index):
-            index = future_to_index[future]
-            try:
-                result = future.result()
-                results_dict[index] = result
-                release_data, summary, error_msg = result
-                info = _extract_release_info(release_data)
+    log_info("Starting concurrent summarization for %d releases", len(release_notifications))
 
-                if error_msg:
-                    logger.error(f"  [{index}/{len(release_notifications)}] Error: {info.repository_name} {info.tag_name}")
-                else:
-                    logger.info(f"  [{index}/{len(release_notifications)}] Completed: {info.repository_name} {info.tag_name} ({len(summary)} chars)")
+    # 同時実行数を制限するセマフォ
+    semaphore = asyncio.Semaphore(20)
+
+    async def _one(index: int, release_data: dict):
+        async with semaphore:
+            try:
+                result = await _summarize_single_release(
+                    release_data,
+                    llm_summarizer,
+                    openai_model,
+                    index,
+                    len(release_notifications)
+                )
             except Exception as e:
-                logger.error(f"  [{index}/{len(release_notifications)}] Unexpected error: {e}")
-                # エラーの場合は空の結果を格納
-                results_dict[index] = (release_notifications[index-1], None, str(e))
+                # 想定外のエラー（不正な通知データ等）も1件分の失敗として
+                # 記録し、他のタスクを道連れにしない
+                info = ReleaseInfo._make(("Unknown", "Unknown", "", "", ""))
+                result = (release_data, info, None, str(e))
+            return index, result
+
+    # 全てのタスクを投入
+    tasks = [
+        asyncio.create_task(_one(idx, release_data))
+        for idx, release_data in enumerate(release_notifications)
+    ]
+
+    # 結果を格納するリスト（インデックスで順序を保持）
+    results = [None] * len(release_notifications)
+
+    # 完了したタスクから結果を収集
+    for coro in asyncio.as_completed(tasks):
+        index, result = await coro
+        results[index] = result
+        release_data, info, summary, error_msg = result
+
+        if error_msg:
+            log_error("  [%d/%d] Error: %s %s", index + 1, len(release_notifications), info.repository_name, info.tag_name)
+        else:
+            log_info("  [%d/%d] Completed: %s %s (%d chars)", index + 1, len(release_notifications), info.repository_name, info.tag_name, len(summary))
 
-    # インデックス順にソートして結果を返す
-    results = [results_dict[i] for i in sorted(results_dict.keys())]
-    logger.info(f"Completed parallel summarization for {len(release_notifications)} releases")
+    log_info("Completed concurrent summarization for %d releases", len(release_notifications))
 
     return results
 
@@ -183,27 +283,28 @@ def handler(ctx, data: io.BytesIO = None):
 
     try:
         if data and data.getvalue():
-            body = json.loads(data.getvalue())
+            body = orjson.loads(data.getvalue())
             test_mode = body.get("test_mode", False)
             since_hours = body.get("since_hours", 24)
-            logger.info(f"Payload: test_mode={test_mode}, since_hours={since_hours}")
+            logger.info("Payload: test_mode=%s, since_hours=%s", test_mode, since_hours)
     except (Exception, ValueError) as ex:
-        logger.warning(f"Error parsing payload (using defaults): {ex}")
+        logger.warning("Error parsing payload (using defaults): %s", ex)
 
     try:
-        # クライアント初期化
-        github_client = GitHubClient(github_token)
-        llm_summarizer = LLMSummarizer(openai_api_key, openai_model)
-        slack_notifier = SlackNotifier(slack_webhook_url)
+        # クライアント初期化（キャッシュ済みならウォーム実行間で再利用。
+        # セッションは閉じずに保持し、次回呼び出しでTLS接続を使い回す）
+        github_client = _get_github_client(github_token)
+        llm_summarizer = _get_llm_summarizer(openai_api_key, openai_model)
+        slack_notifier = _get_slack_notifier(slack_webhook_url)
 
         # GitHub通知を取得
-        logger.info(f"Fetching notifications from the last {since_hours} hours")
+        logger.info("Fetching notifications from the last %s hours", since_hours)
         notifications = github_client.get_notifications(since_hours=since_hours)
-        logger.info(f"Found {len(notifications)} notifications")
+        logger.info("Found %d notifications", len(notifications))
 
         # リリース通知のみをフィルタリング
         release_notifications = github_client.filter_release_notifications(notifications)
-        logger.info(f"Found {len(release_notifications)} release notifications")
+        logger.info("Found %d release notifications", len(release_notifications))
 
         if not release_notifications:
             return success_response(ctx, {
@@ -218,38 +319,70 @@ def handler(ctx, data: io.BytesIO = None):
             release_notifications = release_notifications[:1]
             logger.info("Test mode: limiting to 1 notification")
         else:
-            # 通常モードの場合は古い順に処理（リストを逆順にする）
-            release_notifications = release_notifications[::-1]
+            # 通常モードの場合は古い順に処理（コピーせずインプレースで逆順にする）
+            release_notifications.reverse()
             logger.info("Processing notifications in chronological order (oldest first)")
 
-        # 全てのリリースを並列で要約（ThreadPoolExecutor使用）
-        logger.info("Starting parallel summarization...")
-        summarization_results = _summarize_all_releases_parallel(
-            release_notifications=release_notifications,
-            llm_summarizer=llm_summarizer,
-            logger=logger,
-            openai_model=openai_model
+        # 全てのリリースを常駐ループ上で並行要約（asyncio使用）
+        logger.info("Starting concurrent summarization...")
+        summarization_results = _run_async(
+            _summarize_all_releases_async(
+                release_notifications=release_notifications,
+                llm_summarizer=llm_summarizer,
+                openai_model=openai_model,
+                logger=logger
+            )
         )
-        logger.info("Parallel summarization completed")
+        logger.info("Concurrent summarization completed")
 
         # 要約結果を古い順にSlackに送信
+        # デフォルトはバッチ送信（1回のPOSTにまとめる）。
+        # SLACK_BATCH=false で従来の1件ずつ送信に戻せる。
+        slack_batch = os.getenv("SLACK_BATCH", "true").lower() != "false"
         sent_count = 0
         errors = []
+        to_send = []
 
-        for idx, (release_data, summary, error_msg) in enumerate(summarization_results, 1):
-            info = _extract_release_info(release_data)
-            logger.info(f"[{idx}/{len(summarization_results)}] Sending to Slack: {info.repository_name} {info.tag_name}")
-
+        for release_data, info, summary, error_msg in summarization_results:
             # 要約にエラーがあった場合
             if error_msg:
                 errors.append(error_msg)
-                logger.error(f"  ✗ Summarization failed: {error_msg}")
+                logger.error("  ✗ Summarization failed: %s", error_msg)
                 continue
 
-            # Slackに送信
+            to_send.append((info, summary))
+
+        if slack_batch:
+            # 全リリースを1回のPOSTにまとめて送信
             try:
-                logger.info("  Sending to Slack...")
-                success = slack_notifier.send_release_notification(
+                logger.info("Sending %d release(s) to Slack in one batch", len(to_send))
+                success = slack_notifier.send_release_batch([
+                    {
+                        "repository": info.repository_name,
+                        "version": info.tag_name,
+                        "summary": summary,
+                        "release_url": info.release_url,
+                        "published_at": info.published_at
+                    }
+                    for info, summary in to_send
+                ])
+
+                if success:
+                    sent_count = len(to_send)
+                    logger.info("  ✓ Successfully sent batch to Slack")
+                else:
+                    errors.append("Slack batch send failed")
+                    logger.error("  ✗ Failed to send batch to Slack")
+
+            except Exception as e:
+                errors.append(f"Slack batch error: {str(e)}")
+                logger.error("  ✗ Error sending batch to Slack: %s", e)
+        else:
+            # 1件ずつの送信もクリティカルパスを短縮するため並列でPOSTする
+            logger.info("Sending %d release(s) to Slack in parallel", len(to_send))
+
+            def _send_one(info, summary):
+                return slack_notifier.send_release_notification(
                     repository=info.repository_name,
                     version=info.tag_name,
                     summary=summary,
@@ -257,18 +390,27 @@ def handler(ctx, data: io.BytesIO = None):
                     published_at=info.published_at
                 )
 
-                if success:
-                    sent_count += 1
-                    logger.info(f"  ✓ Successfully sent to Slack")
-                else:
-                    error_msg = f"{info.repository_name} {info.tag_name}: Slack send failed"
-                    errors.append(error_msg)
-                    logger.error(f"  ✗ Failed to send to Slack")
-
-            except Exception as e:
-                error_msg = f"{info.repository_name} {info.tag_name}: Slack error: {str(e)}"
-                errors.append(error_msg)
-                logger.error(f"  ✗ Error sending to Slack: {e}")
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                future_to_info = {
+                    executor.submit(_send_one, info, summary): info
+                    for info, summary in to_send
+                }
+
+                for future in as_completed(future_to_info):
+                    info = future_to_info[future]
+                    try:
+                        if future.result():
+                            sent_count += 1
+                            logger.info("  ✓ Sent to Slack: %s %s", info.repository_name, info.tag_name)
+                        else:
+                            error_msg = f"{info.repository_name} {info.tag_name}: Slack send failed"
+                            errors.append(error_msg)
+                            logger.error("  ✗ Failed to send to Slack: %s %s", info.repository_name, info.tag_name)
+
+                    except Exception as e:
+                        error_msg = f"{info.repository_name} {info.tag_name}: Slack error: {str(e)}"
+                        errors.append(error_msg)
+                        logger.error("  ✗ Error sending to Slack: %s", e)
 
         # 結果を返す
         result = {
@@ -281,19 +423,20 @@ def handler(ctx, data: io.BytesIO = None):
             "errors": errors if errors else None
         }
 
-        logger.info(f"Completed: {sent_count}/{len(release_notifications)} sent")
+        logger.info("Completed: %d/%d sent", sent_count, len(release_notifications))
         return success_response(ctx, result)
 
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         return error_response(ctx, str(e))
 
 
 def success_response(ctx, data: dict):
     """成功レスポンスを返す"""
+    # orjsonは常にUTF-8で出力するためensure_ascii指定は不要
     return response.Response(
         ctx,
-        response_data=json.dumps(data, ensure_ascii=False, indent=2),
+        response_data=orjson.dumps(data, option=orjson.OPT_INDENT_2).decode(),
         headers={"Content-Type": "application/json"}
     )
 
@@ -302,9 +445,9 @@ def error_response(ctx, error_message: str):
     """エラーレスポンスを返す"""
     return response.Response(
         ctx,
-        response_data=json.dumps({
+        response_data=orjson.dumps({
             "error": error_message
-        }, ensure_ascii=False),
+        }).decode(),
         headers={"Content-Type": "application/json"},
         status_code=500
     )
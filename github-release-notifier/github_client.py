@@ -2,7 +2,10 @@
 GitHub Notifications API クライアント
 """
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any, Optional
 
@@ -23,6 +26,24 @@ class GitHubClient:
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        # Sessionを再利用してKeep-Alive・コネクションプーリングを有効化
+        # （リリース詳細取得のたびにTCP+TLSハンドシェイクを繰り返さない）
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=20)
+        )
+
+    def close(self):
+        """セッションを閉じてコネクションを解放"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def get_notifications(self, since_hours: int = 24) -> List[Dict[str, Any]]:
         """
@@ -45,9 +66,10 @@ class GitHubClient:
         }
 
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            return response.json()
+            # response.json()よりも高速にパースし、文字コード判定もスキップする
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             raise Exception(f"GitHub API request failed: {e}")
 
@@ -62,9 +84,9 @@ class GitHubClient:
             リリース詳細（取得失敗時はNone）
         """
         try:
-            response = requests.get(release_url, headers=self.headers, timeout=30)
+            response = self.session.get(release_url, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException:
             # リリース詳細の取得に失敗してもスキップして処理を継続
             return None
@@ -79,23 +101,49 @@ class GitHubClient:
         Returns:
             リリース通知のリスト（詳細情報付き）
         """
-        release_notifications = []
-
+        # リリース通知のみを対象（詳細取得前に一覧を確定させる）
+        targets = []
         for notification in notifications:
             subject = notification.get("subject", {})
-            subject_type = subject.get("type")
-
-            # リリース通知のみを対象
-            if subject_type == "Release":
-                # リリース詳細を取得
-                release_url = subject.get("url")
-                if release_url:
-                    release_details = self.get_release_details(release_url)
-                    if release_details:
-                        # 通知とリリース詳細を結合
-                        release_notifications.append({
-                            "notification": notification,
-                            "release": release_details
-                        })
+            if subject.get("type") == "Release" and subject.get("url"):
+                targets.append(notification)
+
+        if not targets:
+            return []
+
+        # リリース詳細を並列取得（Sessionのコネクションプールを共有）
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            details = list(executor.map(
+                self.get_release_details,
+                [n["subject"]["url"] for n in targets]
+            ))
+
+        release_notifications = []
+        # 同一リリースの重複通知（再購読やミラー等）は(リポジトリ, タグ)で除外
+        seen = set()
+        dropped = 0
+
+        for notification, release_details in zip(targets, details):
+            # 詳細の取得に失敗した通知はスキップ
+            if not release_details:
+                continue
+
+            key = (
+                notification.get("repository", {}).get("full_name"),
+                release_details.get("tag_name")
+            )
+            if key in seen:
+                dropped += 1
+                continue
+            seen.add(key)
+
+            # 通知とリリース詳細を結合
+            release_notifications.append({
+                "notification": notification,
+                "release": release_details
+            })
+
+        if dropped:
+            print(f"Skipped {dropped} duplicate release notification(s)")
 
         return release_notifications
@@ -2,8 +2,77 @@
 LLM要約モジュール
 """
 
+import asyncio
+import functools
 import os
-from openai import OpenAI
+from openai import AsyncOpenAI, RateLimitError
+
+
+@functools.lru_cache(maxsize=1)
+def _load_prompt_template() -> str:
+    """
+    プロンプトテンプレートをファイルから読み込み（初回のみ、以降はキャッシュ）
+
+    Returns:
+        プロンプトテンプレート文字列
+    """
+    # このファイルと同じディレクトリからテンプレートを読み込む
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    template_path = os.path.join(current_dir, "prompt_template.txt")
+
+    try:
+        with open(template_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        raise Exception(f"Prompt template file not found: {template_path}")
+
+
+class AsyncRateLimiter:
+    """
+    非同期レートリミッター（セマフォ + トークンバケット）
+
+    同時実行数を制限しつつ、リクエスト開始間隔を1/rate_per_sec秒に
+    広げることで、429エラーによるSDK内部の指数バックオフを回避する。
+    """
+
+    def __init__(self, rate_per_sec: float, concurrency: int):
+        """
+        初期化
+
+        Args:
+            rate_per_sec: 1秒あたりのリクエスト数上限
+            concurrency: 同時実行数上限
+        """
+        self.rate_per_sec = rate_per_sec
+        self.concurrency = concurrency
+        self._loop = None
+        self._semaphore = None
+        self._lock = None
+        self._next_slot = 0.0
+
+    def _ensure_loop(self):
+        # asyncioプリミティブはイベントループに紐づくため、
+        # ループが変わった場合（asyncio.runの呼び直し）は作り直す
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._lock = asyncio.Lock()
+            self._next_slot = 0.0
+
+    async def __aenter__(self):
+        self._ensure_loop()
+        await self._semaphore.acquire()
+        async with self._lock:
+            now = self._loop.time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + 1.0 / self.rate_per_sec
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self._semaphore.release()
 
 
 class LLMSummarizer:
@@ -18,27 +87,15 @@ class LLMSummarizer:
             model_name: 使用するモデル名
             temperature: モデルの温度パラメータ
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(api_key=api_key)
         self.model_name = model_name
         self.temperature = temperature
-        self.system_prompt = self._load_prompt_template()
-
-    def _load_prompt_template(self) -> str:
-        """
-        プロンプトテンプレートをファイルから読み込み
-
-        Returns:
-            プロンプトテンプレート文字列
-        """
-        # このファイルと同じディレクトリからテンプレートを読み込む
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        template_path = os.path.join(current_dir, "prompt_template.txt")
-
-        try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except FileNotFoundError:
-            raise Exception(f"Prompt template file not found: {template_path}")
+        self.system_prompt = _load_prompt_template()
+        # リクエストレートはOPENAI_RPSで調整可能（モデルのTPM上限に合わせる）
+        self.rate_limiter = AsyncRateLimiter(
+            rate_per_sec=float(os.getenv("OPENAI_RPS", "5")),
+            concurrency=20
+        )
 
     def _build_user_message(self, repository: str, version: str, release_note: str) -> str:
         """
@@ -89,9 +146,9 @@ class LLMSummarizer:
 
         return api_params
 
-    def summarize(self, repository: str, version: str, release_note: str) -> str:
+    async def summarize(self, repository: str, version: str, release_note: str) -> str:
         """
-        リリースノートを要約
+        リリースノートを要約（非同期）
 
         Args:
             repository: リポジトリ名
@@ -104,7 +161,17 @@ class LLMSummarizer:
         try:
             user_message = self._build_user_message(repository, version, release_note)
             api_params = self._build_api_params(user_message)
-            response = self.client.chat.completions.create(**api_params)
+
+            # レートリミッター経由で呼び出し、429の場合はスロットを
+            # 解放してから再投入する（最大5回）
+            for attempt in range(5):
+                async with self.rate_limiter:
+                    try:
+                        response = await self.client.chat.completions.create(**api_params)
+                        break
+                    except RateLimitError:
+                        if attempt == 4:
+                            raise
 
             summary = response.choices[0].message.content
             return summary if summary else ""
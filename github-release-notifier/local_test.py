@@ -4,11 +4,11 @@
 OCI Functionのロジックを fn invoke を使わずにローカルで実行します
 """
 
+import asyncio
 import os
 import sys
 import json
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # 同じディレクトリのモジュールをインポート
@@ -17,104 +17,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 from github_client import GitHubClient
 from llm_summarizer import LLMSummarizer
 from slack_notifier import SlackNotifier
-from func import ReleaseInfo, _extract_release_info
-
-
-def _summarize_single_release(
-    release_data: dict,
-    llm_summarizer: LLMSummarizer,
-    openai_model: str,
-    index: int,
-    total: int
-) -> tuple[dict, str, str]:
-    """
-    単一のリリースを要約（スレッドプール用）
-
-    Args:
-        release_data: リリースデータ（notification + release）
-        llm_summarizer: LLM要約クライアント
-        openai_model: 使用するOpenAIモデル名（未使用だがシグネチャ保持のため残す）
-        index: インデックス（未使用だがシグネチャ保持のため残す）
-        total: 総数（未使用だがシグネチャ保持のため残す）
-
-    Returns:
-        (リリースデータ, 要約, エラーメッセージ)
-    """
-    info = _extract_release_info(release_data)
-
-    try:
-        summary = llm_summarizer.summarize(
-            repository=info.repository_name,
-            version=info.tag_name,
-            release_note=info.release_body
-        )
-        return (release_data, summary, None)
-
-    except Exception as e:
-        error_msg = f"{info.repository_name} {info.tag_name}: {str(e)}"
-        return (release_data, None, error_msg)
-
-
-def _summarize_all_releases_parallel(
-    release_notifications: list,
-    llm_summarizer: LLMSummarizer,
-    openai_model: str
-) -> list[tuple[dict, str, str]]:
-    """
-    全てのリリースを並列要約（ThreadPoolExecutor使用）
-
-    Args:
-        release_notifications: リリース通知リスト
-        llm_summarizer: LLM要約クライアント
-        openai_model: 使用するOpenAIモデル名
-
-    Returns:
-        [(リリースデータ, 要約, エラーメッセージ), ...]
-    """
-    print(f"🚀 Starting parallel summarization for {len(release_notifications)} releases")
-
-    # 結果を格納する辞書（インデックスで順序を保持）
-    results_dict = {}
-
-    # ThreadPoolExecutorで並列実行
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        # 全てのタスクを投入
-        future_to_index = {
-            executor.submit(
-                _summarize_single_release,
-                release_data,
-                llm_summarizer,
-                openai_model,
-                idx,
-                len(release_notifications)
-            ): idx
-            for idx, release_data in enumerate(release_notifications, 1)
-        }
-
-        # 完了したタスクから結果を収集
-        for future in as_completed(future_to_index):
-            index = future_to_index[future]
-            try:
-                result = future.result()
-                results_dict[index] = result
-                release_data, summary, error_msg = result
-                info = _extract_release_info(release_data)
-
-                if error_msg:
-                    print(f"  [{index}/{len(release_notifications)}] Error: {info.repository_name} {info.tag_name}")
-                else:
-                    print(f"  [{index}/{len(release_notifications)}] Completed: {info.repository_name} {info.tag_name} ({len(summary)} chars)")
-            except Exception as e:
-                print(f"  [{index}/{len(release_notifications)}] Unexpected error: {e}")
-                # エラーの場合は空の結果を格納
-                results_dict[index] = (release_notifications[index-1], None, str(e))
-
-    # インデックス順にソートして結果を返す
-    results = [results_dict[i] for i in sorted(results_dict.keys())]
-    print(f"✓ Completed parallel summarization for {len(release_notifications)} releases")
-    print()
-
-    return results
+# 要約ヘルパーはfunc.pyと共通（loggerを渡さない場合はprintに出力）
+from func import _summarize_all_releases_async
 
 
 def main():
@@ -161,24 +65,24 @@ def main():
     try:
         # クライアント初期化
         print("🔧 クライアント初期化中...")
-        github_client = GitHubClient(github_token)
         llm_summarizer = LLMSummarizer(openai_api_key, openai_model)
         if not args.dry_run:
             slack_notifier = SlackNotifier(slack_webhook_url)
         print("✓ 初期化完了")
         print()
 
-        # GitHub通知を取得
-        print(f"🔍 GitHub通知を取得中（過去{args.since_hours}時間）...")
-        notifications = github_client.get_notifications(since_hours=args.since_hours)
-        print(f"✓ {len(notifications)} 件の通知を取得")
-        print()
+        # GitHub通知を取得（コンテキストマネージャーでセッションを確実に解放）
+        with GitHubClient(github_token) as github_client:
+            print(f"🔍 GitHub通知を取得中（過去{args.since_hours}時間）...")
+            notifications = github_client.get_notifications(since_hours=args.since_hours)
+            print(f"✓ {len(notifications)} 件の通知を取得")
+            print()
 
-        # リリース通知のみをフィルタリング
-        print("🔍 リリース通知をフィルタリング中...")
-        release_notifications = github_client.filter_release_notifications(notifications)
-        print(f"✓ {len(release_notifications)} 件のリリース通知を検出")
-        print()
+            # リリース通知のみをフィルタリング
+            print("🔍 リリース通知をフィルタリング中...")
+            release_notifications = github_client.filter_release_notifications(notifications)
+            print(f"✓ {len(release_notifications)} 件のリリース通知を検出")
+            print()
 
         if not release_notifications:
             print("📭 リリース通知はありません")
@@ -190,27 +94,27 @@ def main():
             print(f"⚠️  テストモード: {len(release_notifications)} 件のみ処理")
             print()
         else:
-            # 通常モードの場合は古い順に処理（リストを逆順にする）
-            release_notifications = release_notifications[::-1]
+            # 通常モードの場合は古い順に処理（コピーせずインプレースで逆順にする）
+            release_notifications.reverse()
             print(f"📅 古い順に処理します")
             print()
 
-        # 全てのリリースを並列で要約（ThreadPoolExecutor使用）
-        print("🔄 並列要約を開始...")
+        # 全てのリリースを並行で要約（asyncio使用）
+        print("🔄 並行要約を開始...")
         print()
-        summarization_results = _summarize_all_releases_parallel(
+        summarization_results = asyncio.run(_summarize_all_releases_async(
             release_notifications=release_notifications,
             llm_summarizer=llm_summarizer,
             openai_model=openai_model
-        )
+        ))
+        print()
 
         # 要約結果を古い順にSlackに送信
         sent_count = 0
         errors = []
 
-        for idx, (release_data, summary, error_msg) in enumerate(summarization_results, 1):
+        for idx, (release_data, info, summary, error_msg) in enumerate(summarization_results, 1):
             print("-" * 70)
-            info = _extract_release_info(release_data)
             print(f"[{idx}/{len(summarization_results)}] {info.repository_name} {info.tag_name}")
             print()
 
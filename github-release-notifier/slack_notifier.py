@@ -3,14 +3,20 @@ Slack通知モジュール
 """
 
 import os
-import json
+import orjson
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional
 
 
 class SlackNotifier:
     """Slack通知クライアント"""
 
+    # Slack Webhookのプレーンテキスト上限は40,000文字。
+    # 余裕を持たせてバッチ送信はこの長さで分割する。
+    MAX_TEXT_LENGTH = 35000
+
     def __init__(self, webhook_url: str):
         """
         初期化
@@ -19,6 +25,23 @@ class SlackNotifier:
             webhook_url: Slack Incoming Webhook URL
         """
         self.webhook_url = webhook_url
+        # Sessionを再利用してKeep-Aliveを有効化し、
+        # 一時的な429/5xxはアダプター側で自動リトライする
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+        self.session.mount(
+            "https://hooks.slack.com",
+            HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=10,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["POST"]
+                )
+            )
+        )
 
     def send_simple_message(self, message: str) -> bool:
         """
@@ -35,17 +58,55 @@ class SlackNotifier:
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
-                data=json.dumps(payload),
-                headers={"Content-Type": "application/json"},
+                data=orjson.dumps(payload),
                 timeout=10
             )
             response.raise_for_status()
-            return response.text == "ok"
+            # response.textは文字コード判定が走るためバイト列のまま比較する
+            return response.content == b"ok"
         except requests.exceptions.RequestException as e:
             raise Exception(f"Slack notification failed: {e}")
 
+    def _build_release_message(
+        self,
+        repository: str,
+        version: str,
+        summary: str,
+        release_url: str,
+        published_at: Optional[str] = None
+    ) -> str:
+        """
+        リリース通知のプレーンテキストメッセージを構築
+
+        Args:
+            repository: リポジトリ名
+            version: バージョン
+            summary: 要約
+            release_url: リリースページのURL
+            published_at: 公開日時
+
+        Returns:
+            構築されたメッセージ
+        """
+        # 公開日時がある場合のみ行を追加
+        date_line = f"\nリリース日: {published_at[:10]}" if published_at else ""
+
+        # プレーンテキストメッセージを構築
+        return (
+            f"🆕 {repository} {version} がリリースされました！\n"
+            f"\n"
+            f"リポジトリ: {repository}\n"
+            f"バージョン: {version}{date_line}\n"
+            f"\n"
+            f"📝 主な変更点:\n"
+            f"{summary}\n"
+            f"\n"
+            f"リリースノート: {release_url}\n"
+            f"-"
+        )
+
     def send_release_notification(
         self,
         repository: str,
@@ -67,41 +128,47 @@ class SlackNotifier:
         Returns:
             送信成功フラグ
         """
-        # プレーンテキストメッセージを構築
-        message_parts = [
-            f"🆕 {repository} {version} がリリースされました！",
-            "",
-            f"リポジトリ: {repository}",
-            f"バージョン: {version}"
-        ]
-
-        # 公開日時がある場合は追加
-        if published_at:
-            message_parts.append(f"リリース日: {published_at[:10]}")
-
-        message_parts.extend([
-            "",
-            "📝 主な変更点:",
-            summary,
-            "",
-            f"リリースノート: {release_url}",
-            "-"
-        ])
-
-        message = "\n".join(message_parts)
+        message = self._build_release_message(
+            repository=repository,
+            version=version,
+            summary=summary,
+            release_url=release_url,
+            published_at=published_at
+        )
+        return self.send_simple_message(message)
+
+    def send_release_batch(self, releases: List[Dict[str, Any]]) -> bool:
+        """
+        複数のリリース通知をまとめて送信（1回のWebhook POST）
 
-        payload = {
-            "text": message
-        }
+        Args:
+            releases: リリース情報の辞書のリスト
+                （repository, version, summary, release_url, published_at）
 
-        try:
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(payload),
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.text == "ok"
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Slack notification failed: {e}")
+        Returns:
+            送信成功フラグ（全バッチ成功時のみTrue）
+        """
+        if not releases:
+            return True
+
+        messages = [self._build_release_message(**release) for release in releases]
+
+        # プレーンテキスト上限を超えないようにまとめる
+        batches = []
+        current_parts = []
+        current_length = 0
+        for message in messages:
+            if current_parts and current_length + len(message) > self.MAX_TEXT_LENGTH:
+                batches.append("\n".join(current_parts))
+                current_parts = []
+                current_length = 0
+            current_parts.append(message)
+            current_length += len(message) + 1
+        batches.append("\n".join(current_parts))
+
+        success = True
+        for batch in batches:
+            if not self.send_simple_message(batch):
+                success = False
+
+        return success